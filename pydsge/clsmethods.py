@@ -497,6 +497,7 @@ DSGE_RAW.cmaes = cmaes
 DSGE_RAW.create_filter = create_filter
 DSGE_RAW.run_filter = run_filter
 DSGE_RAW.get_ll = get_ll
+DSGE_RAW.set_par_and_get_ll = set_par_and_get_ll
 # from plot
 DSGE_RAW.traceplot = traceplot_m
 DSGE_RAW.posteriorplot = posteriorplot_m
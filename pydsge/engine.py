@@ -11,6 +11,23 @@ aca = np.ascontiguousarray
 si_eps = sys.float_info.epsilon
 
 
+@njit(cache=True, nogil=True)
+def nonzero_cols_jit(M, tol):
+    """jitted mask of the columns of `M` with at least one nonzero entry. Equivalent to `~fast0(M, 0)`, but in a single sweep and without a temporary of the size of `M`
+    """
+
+    nrows, ncols = M.shape
+    res = np.zeros(ncols, dtype=np.bool_)
+
+    for j in range(ncols):
+        for i in range(nrows):
+            if abs(M[i, j]) >= tol:
+                res[j] = True
+                break
+
+    return res
+
+
 @njit(cache=True, nogil=True)
 def get_lam(omg, psi, S, T, V, W, h, l):
 
@@ -8,7 +8,7 @@ import pathos
 import time
 import tqdm
 from .stats import get_prior
-from .filtering import get_ll
+from .filtering import get_ll, set_par_and_get_ll
 from .mpile import get_par, set_par
 
 
@@ -120,14 +120,9 @@ def prep_estim(self, N=None, linear=None, load_R=False, seed=None, eval_priors=F
                 np.random.seed(seed)
 
                 par_fix[prior_arg] = parameters
-                par_active_lst = list(par_fix)
 
-                # the gen_sys and following part replicates call to set_par, redundant
-                self.gen_sys(par=par_active_lst, l_max=l_max,
-                             k_max=k_max, verbose=verbose > 3)
-                self.filter.Q = self.QQ(self.ppar) @ self.QQ(self.ppar)
-
-                ll = get_ll(self, verbose=verbose > 3, dispatch=dispatch)
+                ll = set_par_and_get_ll(self, par_fix, l_max=l_max, k_max=k_max,
+                                        dispatch=dispatch, verbose=verbose > 3)
 
                 np.random.set_state(random_state)
                 return ll
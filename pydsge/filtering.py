@@ -4,11 +4,22 @@
 import time
 import numpy as np
 import pandas as pd
+from functools import partial
+from scipy.linalg.blas import dsyrk
 from econsieve import KalmanFilter, TEnKF
 from grgrlib.core import timeprint
 from econsieve.stats import logpdf
 
 
+def sym_square(A):
+    """Returns `A @ A.T`, computing only the upper triangle (via BLAS' `dsyrk`)
+    """
+
+    AAT = dsyrk(1., A)
+
+    return AAT + np.triu(AAT, 1).T
+
+
 def create_obs_cov(self, scale_obs=0.1):
 
     self.Z = np.array(self.data)
@@ -63,9 +74,9 @@ def create_filter(self, R=None, N=None, ftype=None, seed=None, incl_obs=False, r
     f.init_P = f.P
 
     try:
-        f.Q = self.QQ(self.ppar) @ self.QQ(self.ppar)
+        f.Q = sym_square(self.QQ(self.ppar))
     except AttributeError:
-        f.Q = self.fdict['QQ'] @ self.fdict['QQ']
+        f.Q = sym_square(self.fdict['QQ'])
     self.filter = f
 
     return f
@@ -75,6 +86,33 @@ def get_ll(self, **args):
     return run_filter(self, smoother=False, get_ll=True, **args)
 
 
+def set_par_and_get_ll(self, par, l_max=None, k_max=None, dispatch=False, seed=None, verbose=False):
+    """Set the parameters and return the log-likelihood in one go
+
+    This is the lean equivalent of calling `set_par` followed by `get_ll`, meant for the likelihood evaluation during estimation. Unlike `set_par`, it neither parses the input nor returns the full parameter vector.
+
+    Parameters
+    ----------
+    par : array or list
+        The full parameter vector
+    l_max : int, optional
+        The expected number of periods *until* the constraint binds (defaults to 3).
+    k_max : int, optional
+        The expected number of periods for which the constraint binds (defaults to 17).
+    dispatch : bool, optional
+        Whether to use jitted transition and observation functions. Defaults to False
+    seed : int, optional
+        Random seed passed to the filter
+    verbose : bool or int, optional
+        Level of verbosity (default: 0)
+    """
+
+    self.gen_sys(par=par, l_max=l_max, k_max=k_max, verbose=verbose)
+    self.filter.Q = sym_square(self.QQ(self.ppar))
+
+    return run_filter(self, smoother=False, get_ll=True, dispatch=dispatch, seed=seed, verbose=verbose)
+
+
 def run_filter(self, smoother=True, get_ll=False, dispatch=None, rcond=1e-14, seed=None, verbose=False):
 
     if verbose:
@@ -109,7 +147,7 @@ def run_filter(self, smoother=True, get_ll=False, dispatch=None, rcond=1e-14, se
         self.filter.get_eps = get_eps_jit
 
     elif self.filter.reduced_form:
-        self.filter.t_func = lambda *x: self.t_func(*x, get_obs=True)
+        self.filter.t_func = partial(self.t_func, get_obs=True)
         self.filter.o_func = None
 
     else:
@@ -259,14 +297,15 @@ def extract(self, sample=None, nsamples=1, precalc=True, seed=0, nattemps=4, acc
 
         if fname == 'KalmanFilter':
             means, covs = res
-            res = means.copy()
+            # only the last simulated state is needed, so do not copy the full series
+            state = means[0]
             resid = np.empty((means.shape[0]-1, dimeps))
 
             for t, x in enumerate(means[1:]):
-                resid[t] = filter_get_eps(x, res[t])
-                res[t+1] = t_func(res[t], resid[t], linear=True)[0]
+                resid[t] = filter_get_eps(x, state)
+                state = t_func(state, resid[t], linear=True)[0]
 
-            return res[0], resid, 0
+            return means[0].copy(), resid, 0
 
         np.random.shuffle(res)
         sample = np.dstack((obs_func(res), res[..., dimp:]))
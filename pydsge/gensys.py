@@ -9,7 +9,8 @@ import numpy as np
 import scipy.linalg as sl
 import cloudpickle as cpickle
 from grgrlib import fast0, ouc
-from .engine import preprocess
+from .mpile import get_pars_str
+from .engine import preprocess, nonzero_cols_jit
 from .clsmethods import DSGE_RAW
 from .parser import DSGE
 
@@ -85,8 +86,10 @@ def gen_sys_from_yaml(self, par=None, l_max=None, k_max=None, get_hx_only=False,
         raise NotImplementedError('Package is only meant to work with OBCs')
 
     # fix value of x_bar
-    if 'x_bar' in [p.name for p in self.parameters]:
-        self.x_bar = self.par[[p.name for p in self.parameters].index('x_bar')]
+    x_bar_old = getattr(self, 'x_bar', None)
+    _, pars_idx = get_pars_str(self)
+    if 'x_bar' in pars_idx:
+        self.x_bar = self.par[pars_idx['x_bar']]
     elif 'x_bar' in self.parafunc[0]:
         pf = self.parafunc
         self.x_bar = pf[1](self.par)[pf[0].index('x_bar')]
@@ -94,6 +97,14 @@ def gen_sys_from_yaml(self, par=None, l_max=None, k_max=None, get_hx_only=False,
         print("Parameter `x_bar` (maximum value of the constraint) not specified. Assuming x_bar = -1 for now.")
         self.x_bar = -1
 
+    # nothing to do if only parameters changed that do not affect the system (e.g. shock covariances)
+    if getattr(self, 'sys_par', None) is not None and hasattr(self, 'par_affects_sys') and not get_hx_only:
+        same_lks = (l_max is None or l_max + 1 == self.lks[0]) and (
+            k_max is None or k_max == self.lks[1])
+        changed = np.array(self.par) != self.sys_par
+        if same_lks and self.x_bar == x_bar_old and not self.par_affects_sys[changed].any():
+            return self
+
     self.vv = np.array([v.name for v in self.variables])
 
     AA0 = self.AA(self.ppar)              # forward
@@ -110,7 +121,16 @@ def gen_sys_from_yaml(self, par=None, l_max=None, k_max=None, get_hx_only=False,
     ZZ0 = self.ZZ0(self.ppar).astype(float)
     ZZ1 = self.ZZ1(self.ppar).squeeze().astype(float)
 
-    return gen_sys(self, AA0, BB0, CC0, DD0, fb0, fc0, fd0, ZZ0, ZZ1, l_max, k_max, get_hx_only, parallel, verbose)
+    # invalidate until the system is complete again
+    self.sys_par = None
+
+    res = gen_sys(self, AA0, BB0, CC0, DD0, fb0, fc0, fd0, ZZ0, ZZ1,
+                  l_max, k_max, get_hx_only, parallel, verbose)
+
+    if not get_hx_only:
+        self.sys_par = np.array(self.par)
+
+    return res
 
 
 def gen_sys(self, AA0, BB0, CC0, DD0, fb0, fc0, fd0, ZZ0, ZZ1, l_max, k_max, get_hx_only, parallel, verbose):
@@ -169,8 +189,12 @@ def gen_sys(self, AA0, BB0, CC0, DD0, fb0, fc0, fd0, ZZ0, ZZ1, l_max, k_max, get
     fc0 = -fc0/fb0[c_arg]
     fb0 = -fb0/fb0[c_arg]
 
+    # nonzero columns of A & C. These masks are kept up to date below instead of sweeping the matrices again
+    nzA = nonzero_cols_jit(AA0, 1e-8)
+    nzC = nonzero_cols_jit(CC0, 1e-8)
+
     # create auxiliry vars for those both in A & C
-    inall = ~fast0(AA0, 0) & ~fast0(CC0, 0)
+    inall = nzA & nzC
     if np.any(inall):
         vv0 = np.hstack((vv0, [v + '_lag' for v in vv0[inall]]))
         AA0 = np.pad(AA0, ((0, sum(inall)), (0, sum(inall))))
@@ -188,18 +212,27 @@ def gen_sys(self, AA0, BB0, CC0, DD0, fb0, fc0, fd0, ZZ0, ZZ1, l_max, k_max, get
         CC0[:, -sum(inall):] = CC0[:, :-sum(inall)][:, inall]
         CC0[:, :-sum(inall)][:, inall] = 0
 
+        nzA = np.pad(nzA, (0, sum(inall)))
+        # the columns in inall were moved to the end of C
+        nzC = np.hstack((nzC & ~inall, np.ones(sum(inall), dtype=bool)))
+
     # create representation in y-space
     AA0 = np.pad(AA0, ((0, dimeps), (0, dimeps)))
     BB0 = sl.block_diag(BB0, np.eye(dimeps))
-    CC0 = np.block([[CC0, DD0], [np.zeros((dimeps, AA0.shape[1]))]])
+    CCy = np.zeros((CC0.shape[0] + dimeps, CC0.shape[1] + DD0.shape[1]))
+    CCy[:CC0.shape[0], :CC0.shape[1]] = CC0
+    CCy[:DD0.shape[0], CC0.shape[1]:] = DD0
+    CC0 = CCy
+    nzA = np.pad(nzA, (0, dimeps))
+    nzC = np.hstack((nzC, nonzero_cols_jit(DD0, 1e-8)))
     fb0 = np.pad(fb0, (0, dimeps))
     if fd0 is not None:
         fc0 = -np.hstack((fc0, fd0))
     else:
         fc0 = np.pad(fc0, (0, dimeps))
 
-    inq = ~fast0(CC0, 0) | ~fast0(fc0)
-    inp = (~fast0(AA0, 0) | ~fast0(BB0, 0)) & ~inq
+    inq = nzC | ~fast0(fc0)
+    inp = (nzA | nonzero_cols_jit(BB0, 1e-8)) & ~inq
 
     # check dimensionality
     dimq = sum(inq)
@@ -269,8 +302,10 @@ def gen_sys(self, AA0, BB0, CC0, DD0, fb0, fc0, fd0, ZZ0, ZZ1, l_max, k_max, get
     Z11 = Z[:dimq, :dimq]
     Z21 = Z[dimq:, :dimq]
 
-    omg = Z21 @ sl.inv(Z11)
-    lam = Z11 @ sl.inv(S11) @ T11 @ sl.inv(Z11)
+    # factorize Z11 only once instead of inverting it twice
+    lu_Z11 = sl.lu_factor(Z11)
+    omg = sl.lu_solve(lu_Z11, Z21.T, trans=1).T
+    lam = sl.lu_solve(lu_Z11, (Z11 @ sl.solve(S11, T11)).T, trans=1).T
 
     # finally add relevant stuff to the class
 
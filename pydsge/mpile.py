@@ -8,6 +8,7 @@
 import numpy as np
 import time
 from .stats import post_mean
+from .filtering import sym_square
 
 
 def posterior_sampler(self, nsamples, seed=0, verbose=True):
@@ -23,12 +24,12 @@ def posterior_sampler(self, nsamples, seed=0, verbose=True):
     array
         Numpy array of parameters
     """
-    import random
-    random.seed(seed)
+    rng = np.random.default_rng(seed)
     sample = self.get_chain()[-self.get_tune:]
     sample = sample.reshape(-1, sample.shape[(-1)])
-    sample = random.choices(sample, k=nsamples)
-    return sample
+    # draw with replacement
+    idx = rng.integers(0, sample.shape[0], size=nsamples)
+    return sample[idx]
 
 
 def sample_box(self, dim0, dim1=None, bounds=None, lp_rule=None, verbose=False):
@@ -39,7 +40,9 @@ def sample_box(self, dim0, dim1=None, bounds=None, lp_rule=None, verbose=False):
     dim1 = dim1 or self.ndim
     rule = lp_rule or 'S'
     res = chaospy.Uniform(0, 1).sample(size=(dim0, dim1), rule=rule)
-    res = (bnd[1] - bnd[0]) * res + bnd[0]
+    # scale in-place to avoid full-size temporaries
+    np.multiply(res, bnd[1] - bnd[0], out=res)
+    np.add(res, bnd[0], out=res)
     return res
 
 
@@ -62,7 +65,8 @@ def prior_sampler(self, nsamples, seed=0, test_lprob=False, lks=None, verbose=Tr
     """
 
     import tqdm
-    from grgrlib import map2arr, serializer
+    from grgrlib import serializer
+    from .stats import get_prior_kinds, prior_rvs
 
     l_max, k_max = lks or (None, None)
 
@@ -85,9 +89,17 @@ def prior_sampler(self, nsamples, seed=0, test_lprob=False, lks=None, verbose=Tr
     get_par = serializer(self.get_par)
     lprob = serializer(self.lprob) if test_lprob else None
 
-    def runner(locseed):
+    # draw the whole sample at once. Only rejected draws are redrawn individually
+    prior_kinds = get_prior_kinds(frozen_prior)
+    pdraws = prior_rvs(frozen_prior, nsamples, seed, prior_kinds)
 
-        np.random.seed(seed+locseed)
+    def runner(arg):
+
+        locseed, pdraw = arg
+
+        # equivalent to `SeedSequence(seed).spawn(nsamples)[locseed]`
+        rng = np.random.default_rng(
+            np.random.SeedSequence(seed, spawn_key=(locseed,)))
         done = False
         no = 0
 
@@ -98,9 +110,8 @@ def prior_sampler(self, nsamples, seed=0, test_lprob=False, lks=None, verbose=Tr
             with np.warnings.catch_warnings(record=False):
                 try:
                     np.warnings.filterwarnings('error')
-                    rst = np.random.randint(2**31)  # win explodes with 2**32
-                    pdraw = [pl.rvs(random_state=rst+sn)
-                             for sn, pl in enumerate(frozen_prior)]
+                    if no > 1:
+                        pdraw = prior_rvs(frozen_prior, 1, rng, prior_kinds)[0]
 
                     if test_lprob:
                         draw_prob = lprob(pdraw, linear=None,
@@ -116,13 +127,39 @@ def prior_sampler(self, nsamples, seed=0, test_lprob=False, lks=None, verbose=Tr
 
         return pdraw, no
 
+    def chunk_runner(arg):
+
+        offset, chunk = arg
+
+        return [runner((offset + i, pdraw)) for i, pdraw in enumerate(chunk)]
+
     if verbose > 1:
         print('[prior_sample:]'.ljust(15, ' ') + ' Sampling from the pior...')
 
-    wrapper = tqdm.tqdm if verbose < 2 else (lambda x, **kwarg: x)
-    pmap_sim = wrapper(self.mapper(runner, range(nsamples)), total=nsamples)
+    # with a pool, dispatch draws in chunks (about four per worker) to reduce the IPC overhead
+    use_pool = getattr(self, 'pool', None) is not None and not self.debug
+    if use_pool:
+        import pathos
+        ncores = self.pool.ncpus or pathos.multiprocessing.cpu_count()
+        nchunks = min(nsamples, 4*ncores)
+    else:
+        nchunks = nsamples
+    chunks = np.array_split(pdraws, max(1, nchunks))
+    offsets = np.cumsum([0] + [len(c) for c in chunks[:-1]])
+
+    pbar = tqdm.tqdm(total=nsamples) if verbose < 2 else None
+
+    # accepted draws are written back into the buffer of the initial batch
+    nos = np.empty(nsamples, dtype=int)
+    for offset, res in zip(offsets, self.mapper(chunk_runner, zip(offsets, chunks))):
+        for i, (pdraw, no) in enumerate(res):
+            pdraws[offset + i] = pdraw
+            nos[offset + i] = no
+        if pbar is not None:
+            pbar.update(len(res))
 
-    draws, nos = map2arr(pmap_sim)
+    if pbar is not None:
+        pbar.close()
 
     if verbose:
         smess = ''
@@ -131,7 +168,36 @@ def prior_sampler(self, nsamples, seed=0, test_lprob=False, lks=None, verbose=Tr
         print('[prior_sample:]'.ljust(
             15, ' ') + ' Sampling done. %2.2f%% of the prior is either %sindetermined or explosive.' % (100*(sum(nos)-nsamples)/sum(nos), smess))
 
-    return draws
+    return pdraws
+
+
+def get_pars_str(self):
+    """Names of all parameters and a dict of their indices. These are cached on the first call.
+    """
+
+    if not hasattr(self, 'pars_str'):
+        self.pars_str = tuple(str(p) for p in self.parameters)
+        self.pars_idx = {p: i for i, p in enumerate(self.pars_str)}
+
+    return self.pars_str, self.pars_idx
+
+
+def get_prior_arrays(self):
+    """Types and hyperparameters of the prior as arrays. These are cached on the first call.
+
+    Returns
+    -------
+    tuple
+        Arrays of the distribution types, the first and the second hyperparameter (mean/std or lower/upper bound)
+    """
+
+    if not hasattr(self, 'prior_arrays'):
+        ptypes = np.array([str(self.prior[pp][-3]) for pp in self.prior])
+        pmean = np.array([self.prior[pp][-2] for pp in self.prior], dtype=float)
+        pstdd = np.array([self.prior[pp][-1] for pp in self.prior], dtype=float)
+        self.prior_arrays = ptypes, pmean, pstdd
+
+    return self.prior_arrays
 
 
 def get_par(self, dummy=None, npar=None, asdict=False, full=True, nsamples=1, verbose=False, roundto=5, debug=False, **args):
@@ -176,7 +242,7 @@ def get_par(self, dummy=None, npar=None, asdict=False, full=True, nsamples=1, ve
     if not hasattr(self, 'par'):
         gen_sys(self, verbose=verbose, **args)
     pfnames, pffunc = self.parafunc
-    pars_str = [str(p) for p in self.parameters]
+    pars_str, pars_idx = get_pars_str(self)
     pars = np.array(self.par) if hasattr(
         self, 'par') else np.array(self.par_fix)
     if npar is not None:
@@ -196,8 +262,8 @@ def get_par(self, dummy=None, npar=None, asdict=False, full=True, nsamples=1, ve
     elif not isinstance(dummy, str) or len(dummy) == len(self.prior_arg):
         par_cand = dummy
     else:
-        if dummy in pars_str:
-            p = pars[pars_str.index(dummy)]
+        if dummy in pars_idx:
+            p = pars[pars_idx[dummy]]
             if verbose:
                 print('[get_par:]'.ljust(15, ' ') + '%s = %s' % (dummy, p))
             return p
@@ -208,7 +274,7 @@ def get_par(self, dummy=None, npar=None, asdict=False, full=True, nsamples=1, ve
             return p
         if dummy == 'cov_mat':
             gen_sys(self, pars)
-            p = self.QQ(self.ppar)
+            p = self.QQ(self.ppar).copy()
             if verbose:
                 print('[get_par:]'.ljust(15, ' ') + '%s = %s' % (dummy, p))
             return p
@@ -238,32 +304,19 @@ def get_par(self, dummy=None, npar=None, asdict=False, full=True, nsamples=1, ve
                 par_cand = self.fdict['mcmc_mode_x']
             elif dummy == 'calib':
                 par_cand = self.par_fix[self.prior_arg].copy()
-            elif dummy == 'prior_mean':
-                par_cand = []
-                for pp in self.prior.keys():
-                    if self.prior[pp][3] == 'uniform':
-                        par_cand.append(
-                            0.5 * self.prior[pp][(-2)] + 0.5 * self.prior[pp][(-1)])
-                    else:
-                        par_cand.append(self.prior[pp][(-2)])
-
-            elif dummy == 'adj_prior_mean':
-                par_cand = []
-                for pp in self.prior.keys():
-                    if self.prior[pp][3] == 'inv_gamma_dynare':
-                        par_cand.append(self.prior[pp][(-2)] * 10)
-                    else:
-                        if self.prior[pp][3] == 'uniform':
-                            par_cand.append(
-                                0.5 * self.prior[pp][(-2)] + 0.5 * self.prior[pp][(-1)])
-                        else:
-                            par_cand.append(self.prior[pp][(-2)])
+            elif dummy in ('prior_mean', 'adj_prior_mean'):
+                ptypes, pmean, pstdd = get_prior_arrays(self)
+                par_cand = np.where(ptypes == 'uniform',
+                                    0.5 * pmean + 0.5 * pstdd, pmean)
+                if dummy == 'adj_prior_mean':
+                    # adjust for pmean not beeing the actual mean for inv_gamma_dynare
+                    par_cand = np.where(
+                        ptypes == 'inv_gamma_dynare', pmean * 10, par_cand)
 
             elif dummy == 'init':
-                par_cand = self.fdict['init_value']
-                for i in range(self.ndim):
-                    if par_cand[i] is None:
-                        par_cand[i] = self.par_fix[self.prior_arg][i]
+                par_cand = np.array(self.fdict['init_value'], dtype=float)
+                par_cand = np.where(np.isnan(par_cand),
+                                    self.par_fix[self.prior_arg], par_cand)
 
             else:
                 self.par = old_par
@@ -272,8 +325,7 @@ def get_par(self, dummy=None, npar=None, asdict=False, full=True, nsamples=1, ve
     if full:
         if isinstance(dummy, str) and dummy in ('prior', 'post', 'posterior'):
             par = np.tile(pars, (nsamples, 1))
-            for i in range(nsamples):
-                par[i][self.prior_arg] = par_cand[i]
+            par[:, self.prior_arg] = par_cand
 
         else:
             par = np.array(pars)
@@ -285,7 +337,7 @@ def get_par(self, dummy=None, npar=None, asdict=False, full=True, nsamples=1, ve
         return (
             pdict, pfdict)
     if asdict:
-        return dict(zip(np.array(pars_str)[self.prior_arg], np.round(par_cand, roundto)))
+        return dict(zip(self.prior_names, np.round(par_cand, roundto)))
     if nsamples > 1:
         if dummy not in ('prior', 'post', 'posterior'):
             par_cand = par_cand * \
@@ -321,7 +373,7 @@ def set_par(self, dummy=None, setpar=None, npar=None, verbose=False, return_vv=F
     from .gensys import gen_sys_from_yaml as gen_sys
 
     pfnames, pffunc = self.parafunc
-    pars_str = [str(p) for p in self.parameters]
+    pars_str, pars_idx = get_pars_str(self)
     par = np.array(self.par) if hasattr(
         self, 'par') else np.array(self.par_fix)
 
@@ -336,17 +388,17 @@ def set_par(self, dummy=None, setpar=None, npar=None, verbose=False, return_vv=F
         else:
             par = get_par(self, dummy=dummy, asdict=False, full=True,
                           verbose=verbose, **args)
-    elif dummy in pars_str:
+    elif dummy in pars_idx:
         if npar is not None:
             npar = npar.copy()
             if len(npar) == len(self.prior_arg):
                 npar[self.prior_names.index(dummy)] = setpar
             else:
-                npar[pars_str.index(dummy)] = setpar
+                npar[pars_idx[dummy]] = setpar
             if return_vv:
                 return npar, self.vv
             return npar
-        par[pars_str.index(dummy)] = setpar
+        par[pars_idx[dummy]] = setpar
     elif dummy in pfnames:
         raise SyntaxError(
             "Can not set parameter '%s' that is a function of other parameters." % dummy)
@@ -357,8 +409,8 @@ def set_par(self, dummy=None, setpar=None, npar=None, verbose=False, return_vv=F
     gen_sys(self, par=list(par), verbose=verbose, **args)
 
     if hasattr(self, 'filter'):
-        Q = self.QQ(self.ppar) @ self.QQ(self.ppar)
-        self.filter.Q = Q
+        # QQ is symmetric
+        self.filter.Q = sym_square(self.QQ(self.ppar))
 
     if verbose:
         pdict = dict(zip(pars_str, np.round(self.par, roundto)))
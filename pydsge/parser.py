@@ -269,6 +269,28 @@ class DSGE(DSGE_RAW):
 
             return reducer
 
+        def par_reducer(f, maxsize=64):
+            """hack to avoid re-evaluating lambdified matrices for (recently) known parameters
+            """
+
+            cache = OrderedDict()
+
+            def reducer(par):
+                try:
+                    key = tuple(par)
+                    res = cache.pop(key)
+                except TypeError:
+                    # unhashable parameters (e.g. arrays): do not cache
+                    return f(par)
+                except KeyError:
+                    res = f(par)
+                    if len(cache) >= maxsize:
+                        cache.popitem(last=False)
+                cache[key] = res
+                return res
+
+            return reducer
+
         # standard functions
         context['exp'] = implemented_function('exp', np.exp)
         context['log'] = implemented_function('log', np.log)
@@ -326,19 +348,35 @@ class DSGE(DSGE_RAW):
                                 raise SyntaxError(
                                     "Definitions of `para_func` seem to be circular. Last error: "+error_msg)
 
-        ZZ0 = lambdify([self.parameters+self['other_para']], ZZ0)
-        ZZ1 = lambdify([self.parameters+self['other_para']], ZZ1)
-
-        PSI = lambdify([self.parameters+self['other_para']], PSI)
-
-        AA = lambdify([self.parameters+self['other_para']], AA)
-        BB = lambdify([self.parameters+self['other_para']], BB)
-        CC = lambdify([self.parameters+self['other_para']], CC)
-        bb = lambdify([self.parameters+self['other_para']], bb)
-        bb_PSI = lambdify([self.parameters+self['other_para']], bb_PSI)
-
-        psi = lambdify([self.parameters], [ss[str(px)]
-                                           for px in self['other_para']])  # , modules=context_f)
+        # find the parameters that affect the system (and not only the covariances)
+        sys_syms = set()
+        for mat in (AA, BB, CC, PSI, bb, bb_PSI, ZZ0, ZZ1):
+            sys_syms |= mat.free_symbols
+        # x_bar enters the system via `gen_sys`, also if it is a `para_func`
+        sys_syms |= {p for p in self.parameters +
+                     self['other_para'] if p.name == 'x_bar'}
+        for p in self['other_para']:
+            if p in sys_syms:
+                sys_syms |= sympy.sympify(ss[str(p)]).free_symbols
+        sys_names = [str(p) for p in sys_syms]
+        self.par_affects_sys = np.array(
+            [p.name in sys_names for p in self.parameters], dtype=bool)
+
+        # system matrices are cached on the (parsed) parameter vector
+        ZZ0 = par_reducer(lambdify([self.parameters+self['other_para']], ZZ0))
+        ZZ1 = par_reducer(lambdify([self.parameters+self['other_para']], ZZ1))
+
+        PSI = par_reducer(lambdify([self.parameters+self['other_para']], PSI))
+
+        AA = par_reducer(lambdify([self.parameters+self['other_para']], AA))
+        BB = par_reducer(lambdify([self.parameters+self['other_para']], BB))
+        CC = par_reducer(lambdify([self.parameters+self['other_para']], CC))
+        bb = par_reducer(lambdify([self.parameters+self['other_para']], bb))
+        bb_PSI = par_reducer(
+            lambdify([self.parameters+self['other_para']], bb_PSI))
+
+        psi = par_reducer(lambdify([self.parameters], [ss[str(px)]
+                                                       for px in self['other_para']]))  # , modules=context_f)
 
         def compile(px):
             return list(px) + psi(list(px))
@@ -356,7 +394,8 @@ class DSGE(DSGE_RAW):
         self.bb = bb
         self.bb_PSI = bb_PSI
 
-        QQ = lambdify([self.parameters+self['other_para']], self['covariance'])
+        QQ = par_reducer(
+            lambdify([self.parameters+self['other_para']], self['covariance']))
         HH = lambdify([self.parameters+self['other_para']],
                       self['measurement_errors'])
 
@@ -10,6 +10,7 @@ import pandas as pd
 import scipy.stats as ss
 import scipy.optimize as so
 from scipy.special import gammaln
+from numba import njit
 from grgrlib.core import timeprint
 from grgrlib.stats import mode
 
@@ -297,6 +298,105 @@ def get_prior(prior, verbose=False):
     return prior_lst, initv, (lb, ub)
 
 
+# distributions that can be drawn from within `batch_rvs`
+PRIOR_KINDS = 'uniform', 'norm', 'gamma', 'beta', 'invgamma'
+
+
+def get_prior_kinds(frozen_prior):
+    """Classify frozen priors and collect their parameters for `batch_rvs`
+
+    Each prior is represented as `loc + scale*z`, where `z` is drawn from the standardized distribution with shape parameters `a` and `b`. Kind -1 marks distributions that must be drawn using scipy.
+    """
+
+    ndim = len(frozen_prior)
+    kinds = -np.ones(ndim, dtype=np.int64)
+    a = np.ones(ndim)
+    b = np.ones(ndim)
+    loc = np.zeros(ndim)
+    scale = np.ones(ndim)
+
+    for i, pl in enumerate(frozen_prior):
+
+        name = getattr(pl.dist, 'name', None)
+        if name not in PRIOR_KINDS:
+            continue
+
+        shapes = pl.dist.shapes.split(', ') if pl.dist.shapes else []
+        pars = dict(zip(shapes + ['loc', 'scale'], pl.args))
+        pars.update(pl.kwds)
+
+        kinds[i] = PRIOR_KINDS.index(name)
+        a[i] = pars.get('a', 1.)
+        b[i] = pars.get('b', 1.)
+        loc[i] = pars.get('loc', 0.)
+        scale[i] = pars.get('scale', 1.)
+
+    return kinds, a, b, loc, scale
+
+
+@njit(cache=True, nogil=True)
+def batch_rvs(kinds, a, b, loc, scale, out, seed):
+    """jitted sampling of a batch of draws from the prior. Columns of unknown kind are set to NaN
+    """
+
+    np.random.seed(seed)
+    nsamples, ndim = out.shape
+
+    for i in range(nsamples):
+        for j in range(ndim):
+
+            kind = kinds[j]
+            if kind == 0:
+                z = np.random.uniform(0., 1.)
+            elif kind == 1:
+                z = np.random.normal(0., 1.)
+            elif kind == 2:
+                z = np.random.gamma(a[j], 1.)
+            elif kind == 3:
+                z = np.random.beta(a[j], b[j])
+            elif kind == 4:
+                z = 1/np.random.gamma(a[j], 1.)
+            else:
+                z = np.nan
+
+            out[i, j] = loc[j] + scale[j]*z
+
+    return out
+
+
+def prior_rvs(frozen_prior, nsamples, seed=0, prior_kinds=None):
+    """Draw a batch of size `nsamples` from the prior
+
+    Parameters
+    ----------
+    frozen_prior : list
+        List of frozen scipy distributions, as returned by `get_prior`
+    nsamples : int
+        Size of the sample
+    seed : int, SeedSequence or Generator, optional
+        Anything accepted by `np.random.default_rng` (defaults to 0)
+    prior_kinds : tuple, optional
+        Result of `get_prior_kinds`. Will be calculated if not provided
+
+    Returns
+    -------
+    array
+        Array of shape (nsamples, ndim)
+    """
+
+    kinds, a, b, loc, scale = prior_kinds or get_prior_kinds(frozen_prior)
+    rng = np.random.default_rng(seed)
+
+    draws = np.empty((nsamples, len(kinds)))
+    batch_rvs(kinds, a, b, loc, scale, draws, rng.integers(2**31))
+
+    # exotic distributions are drawn column-wise using scipy
+    for i in np.flatnonzero(kinds < 0):
+        draws[:, i] = frozen_prior[i].rvs(size=nsamples, random_state=rng)
+
+    return draws
+
+
 def pmdm_report(self, x_max, res_max, n=np.inf, printfunc=print):
 
     # getting the number of colums isn't that easy